@@ -15,6 +15,8 @@
 
 from collections import OrderedDict
 
+import operator
+
 from functools import reduce
 from tornado import gen
 from collections import Sequence
@@ -64,33 +66,45 @@ def _func_get_rows(df):
     return df.shape[0]
 
 
-def parts_to_ranks(client, worker_info, part_futures):
+def parts_to_sizes(client, part_futures):
+    """
+    Submits the computation of the number of rows of each partition
+    without waiting on the results. This allows the sizes to be computed
+    while other setup, such as building a communicator, is performed.
+    :param part_futures: list of (worker, future) tuples
+    :return: list of futures holding the size of each partition, in the
+        same order of part_futures
+    """
+    return [client.submit(_func_get_rows,
+                          wf[1],
+                          workers=[wf[0]],
+                          pure=False)
+            for wf in part_futures]
+
+
+def parts_to_ranks(client, worker_info, part_futures, size_futures=None):
     """
     Builds a list of (rank, size) tuples of partitions
     :param worker_info: dict of {worker, {"rank": rank }}. Note: \
         This usually comes from the underlying communicator
     :param part_futures: list of (worker, future) tuples
+    :param size_futures: optional list of futures returned by
+        `parts_to_sizes` for part_futures
     :return: [(part, size)] in the same order of part_futures
     """
-    futures = [(worker_info[wf[0]]["rank"],
-                client.submit(_func_get_rows,
-                              wf[1],
-                              workers=[wf[0]],
-                              pure=False))
-               for idx, wf in enumerate(part_futures)]
-
-    sizes = client.compute(list(map(lambda x: x[1], futures)), sync=True)
-    total = reduce(lambda a, b: a + b, sizes)
-
-    return [(futures[idx][0], size) for idx, size in enumerate(sizes)], total
+    if size_futures is None:
+        size_futures = parts_to_sizes(client, part_futures)
 
+    sizes = client.compute(size_futures, sync=True)
+    total = reduce(lambda a, b: a + b, sizes)
 
-def _default_part_getter(f, idx): return f[idx]
+    return [(worker_info[wf[0]]["rank"], size)
+            for wf, size in zip(part_futures, sizes)], total
 
 
 def flatten_grouped_results(client, gpu_futures,
                             worker_results_map,
-                            getter_func=_default_part_getter):
+                            getter_func=operator.getitem):
     """
     This function is useful when a series of partitions have been grouped by
     the worker responsible for the data and the resulting partitions are
@@ -97,8 +97,9 @@ class DecompositionSyncFitMixin(object):
             workers=[wf[0]]))
             for idx, wf in enumerate(data.worker_to_parts.items())])
 
-        wait(list(pca_fit.values()))
-        raise_exception_from_futures(list(pca_fit.values()))
+        pca_fit_futures = list(pca_fit.values())
+        wait(pca_fit_futures)
+        raise_exception_from_futures(pca_fit_futures)
 
         comms.destroy()
 
@@ -59,8 +59,9 @@ class BaseLinearModelSyncFitMixin(object):
             workers=[wf[0]]))
             for idx, wf in enumerate(data.worker_to_parts.items())])
 
-        wait(list(lin_fit.values()))
-        raise_exception_from_futures(list(lin_fit.values()))
+        lin_fit_futures = list(lin_fit.values())
+        wait(lin_fit_futures)
+        raise_exception_from_futures(lin_fit_futures)
 
         comms.destroy()
         return lin_models
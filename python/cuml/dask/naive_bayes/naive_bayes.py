@@ -130,6 +130,15 @@ class MultinomialNB(BaseEstimator,
     def _unique(x):
         return rmm_cupy_ary(cp.unique, x)
 
+    @staticmethod
+    def _unique_labels(Xy):
+        X, y = Xy
+        return MultinomialNB._unique(y)
+
+    @staticmethod
+    def _merge_unique(uniques):
+        return MultinomialNB._unique(rmm_cupy_ary(cp.concatenate, uniques))
+
     @staticmethod
     def _merge_counts_to_model(models):
         modela = first(models)
@@ -176,9 +185,16 @@ class MultinomialNB(BaseEstimator,
 
         futures = DistributedDataHandler.create([X, y], self.client)
 
-        classes = self._unique(y.map_blocks(
-            MultinomialNB._unique).compute()) \
-            if classes is None else classes
+        # Classes are kept on the cluster as a single future so they
+        # are not serialized into every training task
+        if classes is None:
+            uniques = [self.client.submit(self._unique_labels, part,
+                                          pure=False)
+                       for w, part in futures.gpu_futures]
+            classes = reduce(uniques, self._merge_unique,
+                             client=self.client)
+        else:
+            classes = first(self.client.scatter([classes], broadcast=True))
 
         models = [self.client.submit(self._fit, part, classes, self.kwargs,
                                      pure=False)
@@ -257,7 +273,7 @@ class MultinomialNB(BaseEstimator,
         def _count_accurate_predictions(y_hat, y):
             y_hat = rmm_cupy_ary(cp.asarray, y_hat, dtype=y_hat.dtype)
             y = rmm_cupy_ary(cp.asarray, y, dtype=y.dtype)
-            return y.shape[0] - cp.count_nonzero(y-y_hat)
+            return cp.count_nonzero(y == y_hat)
 
         delayed_parts = zip(y_hat.to_delayed(), y.to_delayed())
 
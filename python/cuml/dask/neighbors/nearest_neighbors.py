@@ -14,30 +14,47 @@
 #
 
 from cuml.dask.common import to_dask_cudf, extract_ddf_partitions, \
-    workers_to_parts, parts_to_ranks, raise_exception_from_futures, \
-    flatten_grouped_results, raise_mg_import_exception
+    workers_to_parts, parts_to_ranks, parts_to_sizes, \
+    raise_exception_from_futures, flatten_grouped_results, \
+    raise_mg_import_exception
 
 from dask.distributed import default_client
 from cuml.dask.common.comms import worker_state, CommsContext
 from dask.distributed import wait
 
-from uuid import uuid1
+from collections import namedtuple
+from itertools import count
 
 
 def _func_get_d(f, idx):
-    i, d = f
-    return d[idx]
+    return f["d"][idx]
 
 
 def _func_get_i(f, idx):
-    i, d = f
-    return i[idx]
+    return f["i"][idx]
+
+
+class QueryPlan(namedtuple("QueryPlan",
+                           ["comms", "worker_info",
+                            "idx_parts_to_ranks", "idx_M",
+                            "query_parts_to_ranks", "query_M"])):
+    """
+    Communicator clique and partition-to-rank tables shared by every
+    step of a distributed query.
+    """
+    def destroy(self):
+        """
+        Releases all resources held by the plan
+        """
+        self.comms.destroy()
 
 
 class NearestNeighbors(object):
     """
     Multi-node Multi-GPU NearestNeighbors Model.
     """
+    _key_counter = count()
+
     def __init__(self, client=None, streams_per_handle=0, verbose=False,
                  **kwargs):
         self.client = default_client() if client is None else client
@@ -80,11 +97,12 @@ class NearestNeighbors(object):
                          local_query_parts, query_m, query_parts_to_ranks,
                          rank, k):
 
-        return model.kneighbors(
+        out_i, out_d = model.kneighbors(
             local_idx_parts, idx_m, n, idx_parts_to_ranks,
             local_query_parts, query_m, query_parts_to_ranks,
             rank, k
         )
+        return {"i": out_i, "d": out_d}
 
     @staticmethod
     def _build_comms(index_futures, query_futures, streams_per_handle,
@@ -129,67 +147,105 @@ class NearestNeighbors(object):
 
         return n_neighbors
 
+    def _next_key(self):
+        """
+        Returns a task key prefix unique to this client, avoiding the
+        cost of generating a uuid on every query
+        """
+        return "nn-%s-%d" % (self.client.id, next(self._key_counter))
+
     def _create_models(self, comms):
 
         """
         Each Dask worker creates a single model
         """
-        key = uuid1()
-        nn_models = dict([(worker, self.client.submit(
+        key = self._next_key()
+        nn_models = {worker: self.client.submit(
             NearestNeighbors._func_create_model,
             comms.sessionId,
             **self.model_args,
             workers=[worker],
-            key="%s-%s" % (key, idx)))
-            for idx, worker in enumerate(comms.worker_addresses)])
+            key="%s-%s" % (key, idx))
+            for idx, worker in enumerate(comms.worker_addresses)}
 
         return nn_models
 
+    def _prepare_query(self, index_futures, query_futures):
+        """
+        Builds the communicator clique and the partition-to-rank tables
+        for a query. The returned plan is owned by the caller, which is
+        expected to call `destroy()` once the query has completed.
+        """
+        # Partition sizes don't depend on the communicator, so they are
+        # computed on the workers while the clique is being initialized
+        idx_sizes = parts_to_sizes(self.client, index_futures)
+        query_sizes = parts_to_sizes(self.client, query_futures)
+
+        comms = NearestNeighbors._build_comms(index_futures, query_futures,
+                                              self.streams_per_handle,
+                                              self.verbose)
+
+        try:
+            worker_info = comms.worker_info(comms.worker_addresses)
+
+            idx_parts_to_ranks, idx_M = parts_to_ranks(self.client,
+                                                       worker_info,
+                                                       index_futures,
+                                                       idx_sizes)
+
+            query_parts_to_ranks, query_M = parts_to_ranks(self.client,
+                                                           worker_info,
+                                                           query_futures,
+                                                           query_sizes)
+        except Exception:
+            comms.destroy()
+            raise
+
+        return QueryPlan(comms, worker_info,
+                         idx_parts_to_ranks, idx_M,
+                         query_parts_to_ranks, query_M)
+
     def _query_models(self, n_neighbors,
-                      comms, nn_models,
+                      plan, nn_models,
                       index_futures, query_futures):
 
-        worker_info = comms.worker_info(comms.worker_addresses)
+        comms = plan.comms
+        worker_info = plan.worker_info
 
         index_worker_to_parts = workers_to_parts(index_futures)
         query_worker_to_parts = workers_to_parts(query_futures)
 
-        """
-        Build inputs and outputs
-        """
-        idx_parts_to_ranks, idx_M = parts_to_ranks(self.client,
-                                                   worker_info,
-                                                   index_futures)
-
-        query_parts_to_ranks, query_M = parts_to_ranks(self.client,
-                                                       worker_info,
-                                                       query_futures)
+        idx_parts_to_ranks, idx_M = plan.idx_parts_to_ranks, plan.idx_M
+        query_parts_to_ranks, query_M = plan.query_parts_to_ranks, \
+            plan.query_M
 
         """
         Invoke kneighbors on Dask workers to perform distributed query
         """
 
-        key = uuid1()
-        nn_fit = dict([(worker_info[worker]["rank"], self.client.submit(
-                        NearestNeighbors._func_kneighbors,
-                        nn_models[worker],
-                        index_worker_to_parts[worker] if
-                        worker in index_worker_to_parts else [],
-                        idx_M,
-                        self.n_cols,
-                        idx_parts_to_ranks,
-                        query_worker_to_parts[worker] if
-                        worker in query_worker_to_parts else [],
-                        query_M,
-                        query_parts_to_ranks,
-                        worker_info[worker]["rank"],
-                        n_neighbors,
-                        key="%s-%s" % (key, idx),
-                        workers=[worker]))
-                       for idx, worker in enumerate(comms.worker_addresses)])
-
-        wait(list(nn_fit.values()))
-        raise_exception_from_futures(list(nn_fit.values()))
+        ranks = [worker_info[worker]["rank"]
+                 for worker in comms.worker_addresses]
+
+        key = self._next_key()
+        nn_fit = {ranks[idx]: self.client.submit(
+                  NearestNeighbors._func_kneighbors,
+                  nn_models[worker],
+                  index_worker_to_parts.get(worker, []),
+                  idx_M,
+                  self.n_cols,
+                  idx_parts_to_ranks,
+                  query_worker_to_parts.get(worker, []),
+                  query_M,
+                  query_parts_to_ranks,
+                  ranks[idx],
+                  n_neighbors,
+                  key="%s-%s" % (key, idx),
+                  workers=[worker])
+                  for idx, worker in enumerate(comms.worker_addresses)}
+
+        nn_fit_futures = list(nn_fit.values())
+        wait(nn_fit_futures)
+        raise_exception_from_futures(nn_fit_futures)
 
         """
         Gather resulting partitions and return dask_cudfs
@@ -238,25 +294,24 @@ class NearestNeighbors(object):
                              "before calling kneighbors()")
 
         """
-        Create communicator clique
+        Create communicator clique and partition tables
         """
-        comms = NearestNeighbors._build_comms(self.X, query_futures,
-                                              self.streams_per_handle,
-                                              self.verbose)
-
-        """
-        Initialize models on workers
-        """
-        nn_models = self._create_models(comms)
+        plan = self._prepare_query(self.X, query_futures)
 
-        """
-        Perform model query
-        """
-        nn_fit, out_d_futures, out_i_futures = \
-            self._query_models(n_neighbors, comms, nn_models,
-                               self.X, query_futures)
-
-        comms.destroy()
+        try:
+            """
+            Initialize models on workers
+            """
+            nn_models = self._create_models(plan.comms)
+
+            """
+            Perform model query
+            """
+            nn_fit, out_d_futures, out_i_futures = \
+                self._query_models(n_neighbors, plan, nn_models,
+                                   self.X, query_futures)
+        finally:
+            plan.destroy()
 
         if _return_futures:
             ret = nn_fit, out_i_futures if not return_distance else \
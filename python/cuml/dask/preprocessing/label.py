@@ -146,11 +146,12 @@ class LabelBinarizer(object):
         unique = [self.client_.submit(LabelBinarizer._func_unique_classes, f)
                   for w, f in futures]
 
+        # Partitions can hold different numbers of classes, so the
+        # per-partition arrays are concatenated rather than stacked
         classes = self.client_.compute(unique, True)
         self.classes_ = rmm_cupy_ary(cp.unique,
-                                     rmm_cupy_ary(cp.stack,
-                                                  classes,
-                                                  axis=0))
+                                     rmm_cupy_ary(cp.concatenate,
+                                                  classes))
 
         self.model = LB(**self.kwargs).fit(self.classes_)
 
@@ -67,6 +67,28 @@ def test_basic_functions(labels, cluster):
             client.close()
 
 
+def test_fit_partitions_with_different_classes(cluster):
+
+    client = None
+
+    try:
+
+        client = Client(cluster)
+
+        # Each partition holds a different number of unique classes
+        s = cp.asarray([1, 1, 1, 4, 5, 2, 0, 6, 3], dtype=np.int32)
+        df = dask.array.from_array(s, chunks=3)
+
+        binarizer = LabelBinarizer(client=client, sparse_output=False)
+        binarizer.fit(df)
+
+        assert array_equal(cp.asnumpy(binarizer.classes_),
+                           np.unique(cp.asnumpy(s)))
+    finally:
+        if client is not None:
+            client.close()
+
+
 @pytest.mark.parametrize(
     "labels", [([1, 4, 5, 2, 0, 1, 6, 2, 3, 4],
                 [4, 2, 6, 3, 2, 0, 1]),
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2020, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from cuml.dask.common.part_utils import flatten_grouped_results
+
+
+class _ImmediateClient(object):
+    """
+    Minimal stand-in for a Dask client which runs submitted
+    functions immediately and returns their results.
+    """
+    def __init__(self):
+        self.n_submits = 0
+
+    def submit(self, func, *args, **kwargs):
+        self.n_submits += 1
+        return func(*args)
+
+
+def test_flatten_grouped_results_default_getter():
+
+    client = _ImmediateClient()
+
+    # Partitions of ranks 0 and 1 interleaved in query order
+    gpu_futures = [(0, "p0"), (1, "p1"), (0, "p2"), (1, "p3"), (1, "p4")]
+    worker_results_map = {0: ["r0-0", "r0-1"],
+                          1: ["r1-0", "r1-1", "r1-2"]}
+
+    futures = flatten_grouped_results(client, gpu_futures,
+                                      worker_results_map)
+
+    assert futures == ["r0-0", "r1-0", "r0-1", "r1-1", "r1-2"]
+    assert client.n_submits == len(gpu_futures)
+
+
+def test_flatten_grouped_results_custom_getter():
+
+    client = _ImmediateClient()
+
+    gpu_futures = [(1, "p0"), (0, "p1"), (1, "p2")]
+    worker_results_map = {0: {"i": ["i0-0"], "d": ["d0-0"]},
+                          1: {"i": ["i1-0", "i1-1"], "d": ["d1-0", "d1-1"]}}
+
+    def get_d(f, idx):
+        return f["d"][idx]
+
+    futures = flatten_grouped_results(client, gpu_futures,
+                                      worker_results_map,
+                                      getter_func=get_d)
+
+    assert futures == ["d1-0", "d0-0", "d1-1"]
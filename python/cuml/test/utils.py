@@ -104,20 +104,25 @@ def normalize_clusters(a0, b0, n_clusters):
     return a, b
 
 
+# Conversions to numpy, looked up by the exact input type first and
+# then checked in order with isinstance for subclasses
+_to_nparray_converters = {
+    Number: lambda x: np.asarray([x]),
+    pd.DataFrame: lambda x: x.values,
+    cudf.DataFrame: lambda x: x.to_pandas().values,
+    cudf.Series: lambda x: x.to_pandas().values,
+    DeviceNDArray: lambda x: x.copy_to_host(),
+    cp.ndarray: cp.asnumpy,
+    np.ndarray: np.asarray,
+}
+
+
 def to_nparray(x):
-    if isinstance(x, Number):
-        return np.asarray([x])
-    elif isinstance(x, pd.DataFrame):
-        return x.values
-    elif isinstance(x, cudf.DataFrame):
-        return x.to_pandas().values
-    elif isinstance(x, cudf.Series):
-        return x.to_pandas().values
-    elif isinstance(x, DeviceNDArray):
-        return x.copy_to_host()
-    elif isinstance(x, cp.ndarray):
-        return cp.asnumpy(x)
-    return np.asarray(x)
+    converter = _to_nparray_converters.get(type(x))
+    if converter is None:
+        converter = next((f for t, f in _to_nparray_converters.items()
+                          if isinstance(x, t)), np.asarray)
+    return converter(x)
 
 
 def clusters_equal(a0, b0, n_clusters, tol=1e-4):